@@ -1,210 +1,371 @@
 import sys
-import json
+import functools
 import logging
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import defaultdict, Counter
-from itertools import combinations
+from collections import Counter
+from itertools import chain
 
 # Import data loading functions from quantitative_analysis
-from quantitative_analysis import read_outputfiles
-from data_validate import find_output_files
+from p3_quantitative_analysis import read_outputfiles
+from p2_data_validate import iter_output_files
 from modules.config import OUTPUTS_DIR
 
 
+# Multi-part extensions reported as a single extension (longest first)
+_COMPOUND_EXTENSIONS = ('.pkg.tar.zst', '.tar.gz', '.tar.bz2', '.tar.xz', '.tar.zst',
+                        '.tar.lz4', '.tar.lzma')
+
+
+@functools.lru_cache(maxsize=1 << 20)
 def extract_file_extension(file_path: str) -> str:
     """
     Extract file extension from a file path.
-    
+
+    Results are memoized since the same paths recur across many commits.
+    The suffix is split by hand with the same rules as pathlib's
+    ``Path.suffix`` to avoid building a Path per call.
+
     Args:
         file_path: Path to the file
-        
+
     Returns:
         File extension including the dot (e.g., '.py', '.yaml')
     """
-    path = Path(file_path)
-    extension = path.suffix.lower()
-    
+    name = file_path.rstrip('/').rpartition('/')[2].lower()
+
     # Handle special cases like .tar.gz
-    if path.stem and path.stem.endswith('.tar'):
-        extension = '.tar' + extension
-    
-    return extension if extension else 'no_extension'
+    if name.endswith(_COMPOUND_EXTENSIONS):
+        for extension in _COMPOUND_EXTENSIONS:
+            if name.endswith(extension):
+                return extension
+
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else 'no_extension'
 
 
-def extract_cochanged_extensions(all_data: List[Dict]) -> List[Dict]:
+def annotate_file_extensions(all_data: List[Dict]) -> None:
     """
-    Extract file extensions that are changed together with PaC files in each commit.
-    
+    Store each changed file's extension on its change record, in place.
+
+    Only commits that modify PaC files are annotated, since those are the
+    only ones the co-change analysis reads.
+
     Args:
         all_data: List of repository data from JSON files
-        
-    Returns:
-        List of dictionaries containing commit info and co-changed extensions
     """
-    cochange_data = []
-    
+    for item in all_data:
+        for repo in item['data'].get('repositories', []):
+            for commit in repo.get('commits', []):
+                if not commit.get('has_pac_changes', False):
+                    continue
+                for change in chain(commit.get('pac_changes', []), commit.get('other_changes', [])):
+                    change['extension'] = extract_file_extension(change['file'])
+
+
+def _unique_extensions(changes: List[Dict]) -> List[str]:
+    """Return the distinct extensions of the changed files, in first-seen order."""
+    return list(dict.fromkeys(
+        change['extension'] if 'extension' in change else extract_file_extension(change['file'])
+        for change in changes
+    ))
+
+
+def _iter_cochange_records(all_data: List[Dict]):
+    """
+    Yield one co-change record per commit that modifies PaC files.
+
+    Args:
+        all_data: List of repository data from JSON files
+
+    Yields:
+        Tuples of (project_name, commit_id, pac_extensions, other_extensions,
+        num_pac_files, num_other_files)
+    """
     for item in all_data:
         repository_name = item['repository']
-        data = item['data']
-        
+
         # Process each repository
-        for repo in data.get('repositories', []):
-            repo_id = repo.get('repository_id')
+        for repo in item['data'].get('repositories', []):
             project_name = repo.get('project_name', repository_name)
-            
+
             # Process each commit
             for commit in repo.get('commits', []):
                 if not commit.get('has_pac_changes', False):
                     continue
-                
-                # Extract PAC file extensions
-                pac_extensions = set()
-                for pac_change in commit.get('pac_changes', []):
-                    ext = extract_file_extension(pac_change['file'])
-                    pac_extensions.add(ext)
-                
-                # Extract non-PAC file extensions
-                other_extensions = set()
-                for other_change in commit.get('other_changes', []):
-                    ext = extract_file_extension(other_change['file'])
-                    other_extensions.add(ext)
-                
-                # Store the co-change information
-                if pac_extensions and (pac_extensions or other_extensions):
-                    cochange_data.append({
-                        'repository': project_name,
-                        'commit_id': commit.get('commit_id'),
-                        'pac_extensions': list(pac_extensions),
-                        'other_extensions': list(other_extensions),
-                        'all_extensions': list(pac_extensions | other_extensions),
-                        'num_pac_files': len(commit.get('pac_changes', [])),
-                        'num_other_files': len(commit.get('other_changes', []))
-                    })
-    
-    return cochange_data
-
-
-def calculate_extension_statistics(cochange_data: List[Dict]) -> Dict:
+
+                pac_changes = commit.get('pac_changes', [])
+                pac_extensions = _unique_extensions(pac_changes)
+                if not pac_extensions:
+                    continue
+
+                other_changes = commit.get('other_changes', [])
+                yield (project_name, commit.get('commit_id'), pac_extensions,
+                       _unique_extensions(other_changes), len(pac_changes), len(other_changes))
+
+
+def extract_cochanged_extensions(all_data: List[Dict]) -> Dict[str, Any]:
+    """
+    Extract file extensions that are changed together with PaC files in each commit.
+
+    The result is columnar: apart from the 'total_commits' and
+    'commits_with_other_files' counts tallied during extraction, every key maps
+    to a list (or array) holding one entry per PaC commit, so index ``i`` of
+    each column describes the same commit.
+
+    Args:
+        all_data: List of repository data from JSON files
+
+    Returns:
+        Dictionary of columns containing commit info and co-changed extensions
+    """
+    repositories = []
+    commit_ids = []
+    pac_lists = []
+    other_lists = []
+    num_pac_files = []
+    num_other_files = []
+    commits_with_other_files = 0
+
+    for (project_name, commit_id, pac_extensions, other_extensions,
+         num_pac, num_other) in _iter_cochange_records(all_data):
+        repositories.append(project_name)
+        commit_ids.append(commit_id)
+        pac_lists.append(pac_extensions)
+        other_lists.append(other_extensions)
+        num_pac_files.append(num_pac)
+        num_other_files.append(num_other)
+        if other_extensions:
+            commits_with_other_files += 1
+
+    return {
+        'repository': repositories,
+        'commit_id': commit_ids,
+        'pac_extensions': pac_lists,
+        'other_extensions': other_lists,
+        'all_extensions': [list(dict.fromkeys(pac + other)) for pac, other in zip(pac_lists, other_lists)],
+        'num_pac_files': np.array(num_pac_files, dtype=np.int32),
+        'num_other_files': np.array(num_other_files, dtype=np.int32),
+        'total_commits': len(commit_ids),
+        'commits_with_other_files': commits_with_other_files
+    }
+
+
+def _encode_extensions(extension_lists: List[List[str]]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Encode per-commit extension lists as integer IDs in CSR layout.
+
+    IDs are stored as int16 whenever the vocabulary fits, which keeps the
+    flat arrays small and lets counting use direct array indexing.
+
+    Args:
+        extension_lists: One list of extensions per commit
+
+    Returns:
+        Tuple of (flat extension IDs, offsets into the flat IDs with one entry
+        per commit plus a trailing end offset, vocabulary mapping ID to extension)
+    """
+    lengths = np.fromiter(map(len, extension_lists), dtype=np.int64, count=len(extension_lists))
+    offsets = np.zeros(len(extension_lists) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    ids, vocabulary = pd.factorize(pd.Series(list(chain.from_iterable(extension_lists)), dtype=object))
+    id_dtype = np.int16 if len(vocabulary) <= np.iinfo(np.int16).max else np.int32
+    return ids.astype(id_dtype), offsets, vocabulary.tolist()
+
+
+def _count_pairs(pac_ids: np.ndarray, pac_offsets: np.ndarray,
+                 other_ids: np.ndarray, other_offsets: np.ndarray,
+                 n_pac: int, n_other: int) -> np.ndarray:
+    """
+    Count how many commits contain each (PAC extension, other extension) pair.
+
+    Args:
+        pac_ids, pac_offsets: PAC extension IDs per commit from _encode_extensions
+        other_ids, other_offsets: Other extension IDs per commit from _encode_extensions
+        n_pac: Number of distinct PAC extensions
+        n_other: Number of distinct other extensions
+
+    Returns:
+        Dense n_pac x n_other matrix of pair counts
+    """
+    pac_lengths = np.diff(pac_offsets)
+    other_lengths = np.diff(other_offsets)
+
+    # Every PAC entry pairs with each other-extension entry of its commit
+    pac_commit = np.repeat(np.arange(len(pac_lengths)), pac_lengths)
+    pair_lengths = other_lengths[pac_commit]
+    pair_pac = np.repeat(pac_ids.astype(np.int64), pair_lengths)
+
+    # Index of the paired other-extension entry within the flat other IDs
+    pair_starts = np.repeat(np.cumsum(pair_lengths) - pair_lengths, pair_lengths)
+    within = np.arange(len(pair_pac)) - pair_starts
+    pair_other = other_ids[np.repeat(other_offsets[:-1][pac_commit], pair_lengths) + within]
+
+    return np.bincount(pair_pac * n_other + pair_other,
+                       minlength=n_pac * n_other).reshape(n_pac, n_other)
+
+
+def build_contingency(cochange_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the PAC x other extension contingency table and its marginals in one pass.
+
+    Args:
+        cochange_data: Columnar co-change data from extract_cochanged_extensions
+
+    Returns:
+        Dictionary with the pair count matrix, the extension vocabularies for its
+        rows and columns, the per-extension commit counts and the commit totals
+    """
+    # Intern extensions into integer IDs, keeping the owning commit offsets
+    pac_ids, pac_offsets, pac_vocabulary = _encode_extensions(cochange_data['pac_extensions'])
+    other_ids, other_offsets, other_vocabulary = _encode_extensions(cochange_data['other_extensions'])
+
+    # Count co-occurrences as a PAC x other matrix
+    cochange_matrix = _count_pairs(pac_ids, pac_offsets, other_ids, other_offsets,
+                                   len(pac_vocabulary), len(other_vocabulary))
+
+    # PAC extensions of commits that also change other files (rule antecedents)
+    has_other = np.diff(other_offsets) > 0
+    pac_with_other = has_other[np.repeat(np.arange(len(has_other)), np.diff(pac_offsets))]
+
+    return {
+        'cochange_matrix': cochange_matrix,
+        'pac_vocabulary': pac_vocabulary,
+        'other_vocabulary': other_vocabulary,
+        'pac_counts': np.bincount(pac_ids, minlength=len(pac_vocabulary)),
+        'pac_counts_with_other': np.bincount(pac_ids[pac_with_other], minlength=len(pac_vocabulary)),
+        'other_counts': np.bincount(other_ids, minlength=len(other_vocabulary)),
+        'total_commits': cochange_data['total_commits'],
+        'commits_with_other_files': cochange_data['commits_with_other_files']
+    }
+
+
+def calculate_extension_statistics(contingency: Dict[str, Any]) -> Dict:
     """
     Calculate statistics about file extensions co-changed with PaC files.
     
     Args:
-        cochange_data: List of co-change data from extract_cochanged_extensions
+        contingency: Contingency table and marginals from build_contingency
         
     Returns:
         Dictionary containing various statistics
     """
-    # Count occurrences of each extension type
-    pac_extension_counter = Counter()
-    other_extension_counter = Counter()
-    cochange_counter = Counter()
-    
-    for data in cochange_data:
-        # Count PAC extensions
-        for ext in data['pac_extensions']:
-            pac_extension_counter[ext] += 1
-        
-        # Count other extensions
-        for ext in data['other_extensions']:
-            other_extension_counter[ext] += 1
-        
-        # Count co-occurrences
-        for pac_ext in data['pac_extensions']:
-            for other_ext in data['other_extensions']:
-                cochange_counter[(pac_ext, other_ext)] += 1
-    
+    pac_vocabulary = contingency['pac_vocabulary']
+    other_vocabulary = contingency['other_vocabulary']
+    cochange_matrix = contingency['cochange_matrix']
+    rows, cols = np.nonzero(cochange_matrix)
+
     return {
-        'pac_extensions': pac_extension_counter,
-        'other_extensions': other_extension_counter,
-        'cochange_pairs': cochange_counter,
-        'total_commits': len(cochange_data),
-        'commits_with_other_files': len([d for d in cochange_data if d['other_extensions']])
+        'pac_extensions': Counter(dict(zip(pac_vocabulary, contingency['pac_counts'].tolist()))),
+        'other_extensions': Counter(dict(zip(other_vocabulary, contingency['other_counts'].tolist()))),
+        'cochange_pairs': Counter({
+            (pac_vocabulary[i], other_vocabulary[j]): count
+            for i, j, count in zip(rows.tolist(), cols.tolist(), cochange_matrix[rows, cols].tolist())
+        }),
+        'pac_vocabulary': pac_vocabulary,
+        'other_vocabulary': other_vocabulary,
+        'cochange_matrix': cochange_matrix,
+        'total_commits': contingency['total_commits'],
+        'commits_with_other_files': contingency['commits_with_other_files']
     }
 
 
-def mine_association_rules(cochange_data: List[Dict], min_support: float = 0.01, 
+def mine_association_rules(contingency: Dict[str, Any], min_support: float = 0.01, 
                           min_confidence: float = 0.1) -> List[Dict]:
     """
     Mine association rules between PaC extensions and other file extensions.
     
+    Transactions are the commits that change both PaC and other files.
+    
     Args:
-        cochange_data: List of co-change data
+        contingency: Contingency table and marginals from build_contingency
         min_support: Minimum support threshold (proportion of transactions)
         min_confidence: Minimum confidence threshold
         
     Returns:
         List of association rules with metrics
     """
-    # Create transaction database
-    transactions = []
-    for data in cochange_data:
-        if data['pac_extensions'] and data['other_extensions']:
-            # Create items as "pac:.ext" and "other:.ext" to distinguish them
-            transaction = set()
-            for ext in data['pac_extensions']:
-                transaction.add(f"pac:{ext}")
-            for ext in data['other_extensions']:
-                transaction.add(f"other:{ext}")
-            transactions.append(transaction)
-    
-    if not transactions:
+    total_transactions = contingency['commits_with_other_files']
+    if not total_transactions:
         return []
     
-    total_transactions = len(transactions)
     min_support_count = int(min_support * total_transactions)
+    pac_vocabulary = contingency['pac_vocabulary']
+    other_vocabulary = contingency['other_vocabulary']
+    counts = contingency['cochange_matrix']
+    
+    # Item frequencies aligned with the table axes
+    antecedent_counts = contingency['pac_counts_with_other']
+    consequent_counts = contingency['other_counts']
     
-    # Calculate item frequencies
-    item_counts = Counter()
-    for transaction in transactions:
-        for item in transaction:
-            item_counts[item] += 1
-    
-    # Find frequent itemsets of size 2 (we're interested in PAC -> Other rules)
-    pair_counts = Counter()
-    for transaction in transactions:
-        items = list(transaction)
-        for i in range(len(items)):
-            for j in range(i + 1, len(items)):
-                # Only consider PAC -> Other rules
-                if items[i].startswith('pac:') and items[j].startswith('other:'):
-                    pair_counts[(items[i], items[j])] += 1
-                elif items[j].startswith('pac:') and items[i].startswith('other:'):
-                    pair_counts[(items[j], items[i])] += 1
+    # Grade every (PAC, other) pair at once
+    support = counts / total_transactions
+    with np.errstate(divide='ignore', invalid='ignore'):
+        confidence = counts / antecedent_counts[:, None]
+    consequent_support = consequent_counts / total_transactions
+    lift = confidence / consequent_support[None, :]
+    
+    mask = (counts > 0) & (counts >= min_support_count) & (confidence >= min_confidence)
+    rows, cols = np.nonzero(mask)
+    
+    # Sort rules by confidence, then by support (both descending)
+    order = np.lexsort((-support[rows, cols], -confidence[rows, cols]))
+    rows, cols = rows[order], cols[order]
     
     # Generate association rules
-    rules = []
-    for (antecedent, consequent), count in pair_counts.items():
-        if count >= min_support_count:
-            support = count / total_transactions
-            confidence = count / item_counts[antecedent]
-            
-            if confidence >= min_confidence:
-                # Calculate lift
-                consequent_support = item_counts[consequent] / total_transactions
-                lift = confidence / consequent_support if consequent_support > 0 else 0
-                
-                rules.append({
-                    'antecedent': antecedent.replace('pac:', ''),
-                    'consequent': consequent.replace('other:', ''),
-                    'support': support,
-                    'confidence': confidence,
-                    'lift': lift,
-                    'count': count,
-                    'antecedent_count': item_counts[antecedent],
-                    'consequent_count': item_counts[consequent]
-                })
-    
-    # Sort rules by confidence, then by support
-    rules.sort(key=lambda x: (x['confidence'], x['support']), reverse=True)
+    rules = [
+        {
+            'antecedent': antecedent,
+            'consequent': consequent,
+            'support': rule_support,
+            'confidence': rule_confidence,
+            'lift': rule_lift,
+            'count': count,
+            'antecedent_count': antecedent_count,
+            'consequent_count': consequent_count
+        }
+        for (antecedent, consequent, rule_support, rule_confidence, rule_lift,
+             count, antecedent_count, consequent_count) in zip(
+            np.array(pac_vocabulary, dtype=object)[rows].tolist(),
+            np.array(other_vocabulary, dtype=object)[cols].tolist(),
+            support[rows, cols].tolist(),
+            confidence[rows, cols].tolist(),
+            lift[rows, cols].tolist(),
+            counts[rows, cols].tolist(),
+            antecedent_counts[rows].tolist(),
+            consequent_counts[cols].tolist()
+        )
+    ]
     
     return rules
 
 
+def top_rules_by_lift(rules: List[Dict], k: int = 3) -> List[Dict]:
+    """
+    Select the k rules with the highest lift without sorting the whole list.
+
+    Ties keep their order in ``rules``, matching a stable descending sort.
+
+    Args:
+        rules: List of association rules
+        k: Number of rules to select
+
+    Returns:
+        Up to k rules ordered by descending lift
+    """
+    if not rules or k <= 0:
+        return []
+
+    lifts = np.fromiter((rule['lift'] for rule in rules), dtype=np.float64, count=len(rules))
+    k = min(k, len(rules))
+    threshold = np.partition(lifts, len(lifts) - k)[len(lifts) - k]
+    candidates = np.flatnonzero(lifts >= threshold)
+    top = candidates[np.argsort(-lifts[candidates], kind='stable')][:k]
+    return [rules[i] for i in top]
+
+
 def visualize_association_rules(rules: List[Dict], stats: Dict, output_dir: Path = None):
     """
     Create visualizations for association rules and co-change patterns.
@@ -214,6 +375,10 @@ def visualize_association_rules(rules: List[Dict], stats: Dict, output_dir: Path
         stats: Statistics from calculate_extension_statistics
         output_dir: Directory to save visualizations
     """
+    # Plotting libraries are slow to import, so load them only when plotting
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     if output_dir is None:
         output_dir = Path(OUTPUTS_DIR).parent
     
@@ -305,7 +470,7 @@ Total Association Rules: {len(rules)}
 Top 3 Rules by Lift:"""
     
     if rules:
-        top_lift_rules = sorted(rules, key=lambda x: x['lift'], reverse=True)[:3]
+        top_lift_rules = top_rules_by_lift(rules, 3)
         for i, rule in enumerate(top_lift_rules, 1):
             summary_text += f"\n{i}. {rule['antecedent']} � {rule['consequent']}"
             summary_text += f"\n   Lift: {rule['lift']:.2f}, Conf: {rule['confidence']:.2f}"
@@ -379,20 +544,23 @@ def main():
     """Main function to perform association rule mining on co-changed files."""
     try:
         # Load data using functions from quantitative_analysis
-        output_files = find_output_files(OUTPUTS_DIR)
-        all_data = read_outputfiles(output_files)
+        all_data = read_outputfiles(iter_output_files(OUTPUTS_DIR))
+        annotate_file_extensions(all_data)
         
         # Extract co-change information
         print("\nExtracting co-change patterns...")
         cochange_data = extract_cochanged_extensions(all_data)
         
+        # Build the contingency table shared by statistics and rule mining
+        contingency = build_contingency(cochange_data)
+        
         # Calculate statistics
         print("Calculating extension statistics...")
-        stats = calculate_extension_statistics(cochange_data)
+        stats = calculate_extension_statistics(contingency)
         
         # Mine association rules
         print("Mining association rules...")
-        rules = mine_association_rules(cochange_data, min_support=0.1, min_confidence=0.8)
+        rules = mine_association_rules(contingency, min_support=0.1, min_confidence=0.8)
         
         # Print report
         print_association_rules_report(rules, stats)
@@ -19,6 +19,8 @@ REPOSITORIES_THAT_SHOULD_USE_HEAD = ["litmuschaos/chaos-charts", "Azure/AzureDef
 # Default settings
 DEFAULT_REPOS_CSV = REPOS_CSV_PATH
 USE_TEST_MODE = False  # Set to True to use test dataset with single repository
+OBJECT_CACHE_TOTAL_SIZE = 512 * 1024 * 1024  # libgit2 object cache budget shared by all analysis processes
+OBJECT_CACHE_MIN_WORKER_SIZE = 256 * 1024 * 1024  # Per-process floor: libgit2's default cache size
 
 
 FIG_LABEL_FONTSIZE = 18
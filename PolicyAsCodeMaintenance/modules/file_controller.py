@@ -3,6 +3,10 @@ import pygit2
 import os
 from pathlib import Path
 
+# Parsed repository lists keyed by (csv_path, target_no); entries are reused
+# while the CSV file's modification time is unchanged
+_repository_list_cache = {}
+
 
 def load_repository_list(csv_path='repos.csv', target_no = None):
     """
@@ -17,8 +21,21 @@ def load_repository_list(csv_path='repos.csv', target_no = None):
               Returns None in case of error
     """
     try:
-        # Load CSV file
-        df = pd.read_csv(csv_path)
+        # Reuse the parsed list if the CSV has not changed since it was loaded
+        cache_key = (os.path.abspath(csv_path), target_no)
+        mtime = os.path.getmtime(csv_path)
+        cached = _repository_list_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            # Hand out copies so callers cannot modify the cached entries
+            return [dict(repo_info) for repo_info in cached[1]]
+
+        if target_no is None:
+            # Load CSV file with Arrow's multithreaded parser
+            df = pd.read_csv(csv_path, engine='pyarrow')
+        else:
+            # Only the requested row is needed: skip the rows before it and stop
+            # after it instead of parsing the whole file
+            df = pd.read_csv(csv_path, skiprows=range(1, target_no), nrows=1 if target_no >= 1 else 0)
 
         # Check if required columns exist
         required_columns = ['full_name']#'sha'
@@ -27,25 +44,17 @@ def load_repository_list(csv_path='repos.csv', target_no = None):
                 print(f"Error: Column '{col}' not found in CSV file")
                 return None
 
+        # Keep the 1-based row number of each repository in the CSV
+        records = df[['full_name', 'id', 'last_commit_sha']].rename(columns={'last_commit_sha': 'sha'})
+        first_no = 1 if target_no is None else target_no
+        records['index'] = range(first_no, first_no + len(records))
+
         # Convert to list of dictionaries
-        repo_list = []
-        i = 0
-        for index, row in df.iterrows():
-            i+=1
-            if not target_no is None:
-                if not i == target_no:
-                    # print("SKIPPING: ", row['full_name'])
-                    continue
-            repo_info = {
-                'full_name': row['full_name'],
-                'id': row['id'],
-                'sha': row['last_commit_sha'],
-                'index': i
-            }
-            repo_list.append(repo_info)
+        repo_list = records.to_dict(orient='records')
 
         print(f"Loaded {len(repo_list)} repositories from {csv_path}")
-        return repo_list
+        _repository_list_cache[cache_key] = (mtime, repo_list)
+        return [dict(repo_info) for repo_info in repo_list]
 
     except FileNotFoundError:
         print(f"CSV file '{csv_path}' not found")
@@ -60,8 +69,10 @@ def load_repository_list(csv_path='repos.csv', target_no = None):
 
 def list_directories(path):
     try:
-        # Get a list of directories within the specified path
-        directories = [name for name in os.listdir(path) if os.path.isdir(os.path.join(path, name))]
+        # Get a list of directories within the specified path; DirEntry takes the
+        # type from readdir, so no extra stat is needed per entry
+        with os.scandir(path) as entries:
+            directories = [entry.name for entry in entries if entry.is_dir()]
         return directories
     except FileNotFoundError:
         print("File Not Found")
@@ -11,9 +11,40 @@ GIT_DELTA_MODIFIED = 3   # File is modified
 GIT_DELTA_RENAMED = 4    # File is renamed
 GIT_DELTA_COPIED = 5     # File is copied
 
+# Largest tree kept in libgit2's object cache; the default skips trees over 4KB,
+# but diff walks reload the same (often larger) trees repeatedly
+TREE_CACHE_OBJECT_LIMIT = 1024 * 1024
+
+
+def configure_object_cache(max_size):
+    """
+    Size libgit2's object cache for the current process
+
+    The limits are process-wide, so callers running several analyses in
+    parallel should split their memory budget between the processes.
+
+    Args:
+        max_size (int): Maximum number of bytes held in the object cache
+    """
+    pygit2.settings.cache_max_size(max_size)
+    pygit2.settings.cache_object_limit(pygit2.GIT_OBJECT_TREE, TREE_CACHE_OBJECT_LIMIT)
+
+
 def get_commit_changes(repo_path):
+    return dict(iter_commit_changes(repo_path))
+
+
+def iter_commit_changes(repo_path):
+    """
+    Walk the commits of a repository, yielding each one's changes as it is read
+
+    Args:
+        repo_path (str): Path to the cloned repository
+
+    Yields:
+        tuple: (commit_id, commit_info) for each non-merge commit, newest first
+    """
     repo = pygit2.Repository(repo_path)
-    commit_changes = {}
 
     for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL):
         if len(commit.parents) >= 2:
@@ -30,7 +61,8 @@ def get_commit_changes(repo_path):
 
         if commit.parents:
             parent = commit.parents[0]
-            diff = repo.diff(parent.tree, commit.tree)
+            # Only added/deleted line counts are used, so no context lines are needed
+            diff = repo.diff(parent.tree, commit.tree, context_lines=0, interhunk_lines=0)
             
             # Enable line-by-line diff statistics
             diff.find_similar()
@@ -59,12 +91,19 @@ def get_commit_changes(repo_path):
         else:
             # Initial commit (no parents)
             tree = commit.tree
-            # For initial commit, we'll need to walk the tree recursively
-            def walk_tree(tree_obj, prefix=''):
-                for entry in tree_obj:
-                    if entry.type == 'tree':
+            # For initial commit, we'll need to walk the whole tree. A stack of entry
+            # iterators keeps the depth-first order of a recursive walk without
+            # hitting the recursion limit on deeply nested trees
+            def walk_tree(tree_obj):
+                stack = [(iter(tree_obj), '')]
+                while stack:
+                    entries, prefix = stack[-1]
+                    entry = next(entries, None)
+                    if entry is None:
+                        stack.pop()
+                    elif entry.type_str == 'tree':  # entry.type is an int on newer pygit2
                         subtree = repo[entry.id]
-                        walk_tree(subtree, prefix + entry.name + '/')
+                        stack.append((iter(subtree), prefix + entry.name + '/'))
                     else:
                         full_path = prefix + entry.name
                         commit_info['files'].append(full_path)
@@ -74,10 +113,12 @@ def get_commit_changes(repo_path):
                             if hasattr(blob, 'is_binary') and blob.is_binary:
                                 lines = 0
                             elif hasattr(blob, 'data'):
-                                lines = blob.data.decode('utf-8', errors='ignore').count('\n')
+                                # A newline byte never occurs inside a multi-byte UTF-8
+                                # sequence, so counting raw bytes matches the decoded count
+                                lines = blob.data.count(b'\n')
                             else:
                                 lines = 0
-                        except (UnicodeDecodeError, AttributeError):
+                        except AttributeError:
                             lines = 0
                         
                         commit_info['changes'].append({
@@ -92,9 +133,7 @@ def get_commit_changes(repo_path):
             except Exception:
                 pass
 
-        commit_changes[commit_id] = commit_info
-
-    return commit_changes
+        yield commit_id, commit_info
 
 
 def clone_repository(repo_name, cloned_path):
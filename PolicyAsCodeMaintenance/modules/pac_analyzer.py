@@ -1,6 +1,7 @@
 """Policy as Code (PAC) file analysis functionality."""
 import pandas as pd
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,14 +17,25 @@ class PacAnalyzer:
             pac_files_csv_path: Path to CSV file containing repo_id and file paths
         """
         self.pac_files_csv_path = pac_files_csv_path
-        self._pac_files_df = None
+        self._pac_paths_by_repo: Dict[int, FrozenSet[str]] = {}
         self._load_pac_files()
     
     def _load_pac_files(self) -> None:
-        """Load PAC files from CSV into a DataFrame."""
+        """Load PAC files from CSV and index their paths by repository."""
         try:
-            self._pac_files_df = pd.read_csv(self.pac_files_csv_path)
-            logger.info(f"Loaded {len(self._pac_files_df)} PAC file entries")
+            # Only the two lookup columns are needed; Arrow parses them multithreaded.
+            # The DataFrame is not kept, so the analyzer stays small when it is
+            # pickled for pool workers
+            pac_files_df = pd.read_csv(self.pac_files_csv_path, engine='pyarrow', usecols=['repo_id', 'path'])
+
+            # Index PAC paths by repository once so lookups are a hashed set check.
+            # A plain loop over the two columns is several times faster than
+            # DataFrame.groupby here, which builds a Series per repository
+            pac_paths = defaultdict(set)
+            for repo_id, path in zip(pac_files_df['repo_id'].tolist(), pac_files_df['path'].tolist()):
+                pac_paths[repo_id].add(path)
+            self._pac_paths_by_repo = {repo_id: frozenset(paths) for repo_id, paths in pac_paths.items()}
+            logger.info(f"Loaded {len(pac_files_df)} PAC file entries")
         except Exception as e:
             logger.error(f"Failed to load PAC files from {self.pac_files_csv_path}: {e}")
             raise
@@ -38,26 +50,33 @@ class PacAnalyzer:
         Returns:
             True if the file is a PAC file, False otherwise
         """
-        if self._pac_files_df is None:
-            return False
+        return file_path in self.pac_paths_for_repo(repo_id)
+    
+    def pac_paths_for_repo(self, repo_id: int) -> FrozenSet[str]:
+        """Get the paths of all PAC files of a repository.
+        
+        Args:
+            repo_id: Repository ID
             
-        match = self._pac_files_df[
-            (self._pac_files_df['repo_id'] == repo_id) & 
-            (self._pac_files_df['path'] == file_path)
-        ]
-        return not match.empty
+        Returns:
+            Set of PAC file paths (empty if the repository has none)
+        """
+        return self._pac_paths_by_repo.get(repo_id, frozenset())
     
-    def parse_commits(self, commit_changes: Dict[str, Dict]) -> List['Commit']:
+    def parse_commits(self, commit_changes: Union[Dict[str, Dict], Iterable[Tuple[str, Dict]]]) -> List['Commit']:
         """Parse raw commit data into Commit objects.
         
         Args:
-            commit_changes: Dictionary mapping commit IDs to commit info dictionaries
+            commit_changes: Dictionary mapping commit IDs to commit info dictionaries,
+                or an iterable of (commit ID, commit info) pairs consumed as it streams
             
         Returns:
             List of Commit objects
         """
+        if isinstance(commit_changes, dict):
+            commit_changes = commit_changes.items()
         commits = []
-        for commit_id, commit_info in commit_changes.items():
+        for commit_id, commit_info in commit_changes:
             if isinstance(commit_info, dict):
                 commit = Commit()
                 commit.commit_id = commit_id
@@ -83,57 +102,54 @@ class PacAnalyzer:
         """
         pac_changes_count = 0
         pac_commits = {}
+        pac_paths = self.pac_paths_for_repo(repo_id)
         
         for commit in commits:
             pac_files_in_commit = []
+            other_changes = []
             
             # Create a map of file to change stats
             change_map = {change['file']: change for change in commit.changes} if commit.changes else {}
             
+            # Split the files into PAC and other (non-PAC) changes in a single pass
             for file_path in commit.files:
-                if self.is_pac_file(repo_id, file_path):
-                    # Get change info for this file
-                    if file_path in change_map:
-                        change_info = change_map[file_path]
-                        file_status = change_info.get('status', None)
-                        
-                        # Ignore introduction (added) or deletion of PaC files
-                        # Only count modifications (status=3), renames (status=4), or copies (status=5)
-                        # Status values: 1=added, 2=deleted, 3=modified, 4=renamed, 5=copied
-                        if file_status in [1, 2]:  # Skip added or deleted files
-                            logger.debug(f"Skipping {'added' if file_status == 1 else 'deleted'} PaC file: {file_path}")
-                            continue
-                        
-                        # Include line statistics for modified/renamed/copied files
-                        file_info = {
-                            'file': file_path,
-                            'additions': change_info.get('additions', 0),
-                            'deletions': change_info.get('deletions', 0),
-                            'total_changes': change_info.get('total_changes', 0),
-                            'status': file_status
-                        }
-                        pac_files_in_commit.append(file_info)
-                    else:
+                is_pac = file_path in pac_paths
+                # Get change info for this file
+                change_info = change_map.get(file_path)
+                if change_info is None:
+                    if is_pac:
                         # If no change info available, we can't determine status, so skip
-                        logger.debug(f"No change info for PaC file: {file_path}, skipping")
-                        continue
-            
-            # Identify other (non-PAC) changes
-            other_changes = []
-            for file_path in commit.files:
-                if not self.is_pac_file(repo_id, file_path):
-                    # Get change info for this file
-                    if file_path in change_map:
-                        change_info = change_map[file_path]
-                        file_status = change_info.get('status', None)
-
-                        # Ignore introduction (added) or deletion of PaC files
-                        # Only count modifications (status=3), renames (status=4), or copies (status=5)
-                        # Status values: 1=added, 2=deleted, 3=modified, 4=renamed, 5=copied
-                        if file_status in [1, 2]:  # Skip added or deleted files
-                            logger.debug(f"Skipping {'added' if file_status == 1 else 'deleted'} Non-PaC file: {file_path}")
-                            continue
-
+                        logger.debug("No change info for PaC file: %s, skipping", file_path)
+                    else:
+                        other_changes.append({
+                            'file': file_path,
+                            'additions': 0,
+                            'deletions': 0,
+                            'total_changes': 0,
+                            'status': None
+                        })
+                    continue
+                
+                file_status = change_info.get('status', None)
+                
+                # Ignore introduction (added) or deletion of files
+                # Only count modifications (status=3), renames (status=4), or copies (status=5)
+                # Status values: 1=added, 2=deleted, 3=modified, 4=renamed, 5=copied
+                if file_status in [1, 2]:  # Skip added or deleted files
+                    logger.debug("Skipping %s %s file: %s", 'added' if file_status == 1 else 'deleted',
+                                 'PaC' if is_pac else 'Non-PaC', file_path)
+                    continue
+                
+                if is_pac:
+                    # Include line statistics for modified/renamed/copied files
+                    pac_files_in_commit.append({
+                        'file': file_path,
+                        'additions': change_info.get('additions', 0),
+                        'deletions': change_info.get('deletions', 0),
+                        'total_changes': change_info.get('total_changes', 0),
+                        'status': file_status
+                    })
+                else:
                     file_info = {
                         'file': file_path,
                         'additions': 0,
@@ -141,8 +157,7 @@ class PacAnalyzer:
                         'total_changes': 0,
                         'status': None
                     }
-                    if file_path in change_map:
-                        file_info.update(change_map[file_path])
+                    file_info.update(change_info)
                     other_changes.append(file_info)
             
             # Store changes in the commit object
@@ -152,33 +167,41 @@ class PacAnalyzer:
             if pac_files_in_commit:
                 pac_changes_count += len(pac_files_in_commit)
                 pac_commits[commit.commit_id] = pac_files_in_commit
-                logger.debug(f"Commit {commit.commit_id}: {len(pac_files_in_commit)} PAC file(s) changed")
+                logger.debug("Commit %s: %d PAC file(s) changed", commit.commit_id, len(pac_files_in_commit))
         
         return pac_changes_count, pac_commits
     
-    def analyze_repository(self, repo_id: int, repo_full_name: str, commit_changes: Dict[str, Dict], project_name: str = None) -> Dict:
+    def analyze_repository(self, repo_id: int, repo_full_name: str,
+                           commit_changes: Union[Dict[str, Dict], Iterable[Tuple[str, Dict]]],
+                           project_name: str = None) -> Dict:
         """Analyze PAC changes in a repository using Commit objects.
         
         Args:
             repo_id: Repository ID
             repo_full_name: Repository name (e.g., 'aws-cdk')
-            commit_changes: Dictionary mapping commit IDs to commit info dictionaries
+            commit_changes: Dictionary mapping commit IDs to commit info dictionaries,
+                or an iterable of (commit ID, commit info) pairs
             project_name: Full project name including owner (e.g., 'aws/aws-cdk') - will be parsed to extract only owner
             
         Returns:
             Dictionary with analysis results (project_name field will contain only owner)
         """
-        total_commits = len(commit_changes)
-        
         # Parse raw commit data into Commit objects
         commits = self.parse_commits(commit_changes)
+        # Streamed changes have no length; every streamed commit becomes a Commit
+        total_commits = len(commit_changes) if isinstance(commit_changes, dict) else len(commits)
         
         # Count PAC changes using Commit objects
         pac_changes_count, pac_commits = self.count_pac_changes_from_commits(repo_id, commits)
         
-        # Calculate statistics
-        total_added_lines = sum(sum(change.get('additions', 0) for change in commit.changes) for commit in commits)
-        total_deleted_lines = sum(sum(change.get('deletions', 0) for change in commit.changes) for commit in commits)
+        # Calculate statistics in one pass over the changes; the values live in
+        # per-file dicts, so a plain loop beats building arrays to reduce
+        total_added_lines = 0
+        total_deleted_lines = 0
+        for commit in commits:
+            for change in commit.changes:
+                total_added_lines += change.get('additions', 0)
+                total_deleted_lines += change.get('deletions', 0)
         
         # PAC-specific statistics
         pac_added_lines = 0
@@ -191,8 +214,8 @@ class PacAnalyzer:
         # Extract owner from project_name (e.g., 'aws' from 'aws/aws-cdk')
         owner = None
         if project_name and '/' in project_name:
-            owner = project_name.split('/')[0]
-            repo_name = project_name.split('/')[1]
+            owner, _, rest = project_name.partition('/')
+            repo_name = rest.partition('/')[0]
 
         results = {
             'repository_id': repo_id,
@@ -224,6 +247,11 @@ class PacAnalyzer:
 
 
 class Commit:
+    # One instance per commit is kept until the repository is written out, so
+    # avoid a per-instance __dict__
+    __slots__ = ('commit_id', 'author', 'author_email', 'message', 'date',
+                 'files', 'changes', 'pac_changes', 'other_changes')
+
     def __init__(self):
         self.commit_id = None
         self.author = None
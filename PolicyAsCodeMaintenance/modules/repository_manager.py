@@ -1,12 +1,13 @@
 """Repository management functionality for cloning and analyzing repositories."""
 import os
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
 import pygit2
 
 from .config import REPOSITORIES_THAT_SHOULD_USE_HEAD
 from .file_controller import load_repository_list, list_directories
-from .git_controller import get_commit_changes, clone_repository
+from .git_controller import get_commit_changes, iter_commit_changes, clone_repository
 
 logger = logging.getLogger(__name__)
 
@@ -47,26 +48,46 @@ class RepositoryManager:
             logger.error(f"Failed to load repositories from {csv_path}: {e}")
             raise
     
-    def clone_repositories(self, repo_list: List[Dict]) -> Dict[str, int]:
+    def clone_repositories(self, repo_list: List[Dict], max_workers: int = 8) -> Dict[str, int]:
         """Clone all repositories from the repository list.
         
+        Clones are network-bound and pygit2 releases the GIL while libgit2
+        transfers data, so they run concurrently on a thread pool.
+        
         Args:
             repo_list: List of repository information dictionaries
+            max_workers: Maximum number of repositories cloned at the same time
             
         Returns:
             Dictionary with cloning statistics (success, failed, skipped counts)
         """
 
         total = len(repo_list)
-        for i, repo_info in enumerate(repo_list, 1):
-            repo_name = repo_info['full_name']
-            logger.info(f"Cloning repository {i}/{total}: {repo_name}")
-            
-            result = clone_repository(repo_name, self.repos_dir)
+        # Create owner directories up front so concurrent clones do not race on them
+        for repo_info in repo_list:
+            owner_dir = os.path.dirname(os.path.join(self.repos_dir, repo_info['full_name']))
+            os.makedirs(owner_dir, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(clone_repository, repo_info['full_name'], self.repos_dir): repo_info['full_name']
+                for repo_info in repo_list
+            }
+
+            try:
+                for completed, future in enumerate(as_completed(futures), 1):
+                    repo_name = futures[future]
+                    # Re-raise clone failures as before
+                    future.result()
 
-            logger.info(
-                f"Cloning completed: {repo_name} successful, "
-            )
+                    logger.info(
+                        f"Cloning completed ({completed}/{total}): {repo_name} successful, "
+                    )
+            except BaseException:
+                # Fail fast like the serial loop: drop queued clones instead of
+                # letting the pool finish them all before the error surfaces
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
 
     def get_repository_id(self, repo_list: List[Dict], repo_name: str) -> Optional[int]:
@@ -128,11 +149,36 @@ class RepositoryManager:
             logger.error(f"Failed to get changes for {repo_name}: {e}")
             raise RuntimeError("Exception: Failed to get changes for {repo_name}: {e}")
 
-    def checkout(self, repo_list: List[Dict]) -> Dict[str, int]:
+    def iter_repository_changes(self, repo_name: str) -> Iterator[Tuple[str, Dict]]:
+        """Stream commit changes for a repository one commit at a time.
+        
+        Args:
+            repo_name: Name of the repository directory
+            
+        Yields:
+            Tuples of (commit ID, commit info dictionary)
+        """
+        repo_path = os.path.join(self.repos_dir, repo_name)
+        count = 0
+        try:
+            for commit_change in iter_commit_changes(repo_path):
+                count += 1
+                yield commit_change
+        except Exception as e:
+            logger.error(f"Failed to get changes for {repo_name}: {e}")
+            raise RuntimeError(f"Exception: Failed to get changes for {repo_name}: {e}")
+        logger.info(f"Retrieved {count} commits for {repo_name}")
+
+    def checkout(self, repo_list: List[Dict], max_workers: int = 8) -> Dict[str, int]:
         """Checkout specific commits in cloned repositories.
         
+        Each repository is checked out by a single task, and pygit2 releases the
+        GIL while libgit2 writes the working tree, so repositories are checked
+        out concurrently on a thread pool.
+        
         Args:
             repo_list: List of repository information dictionaries containing 'full_name' and 'sha'
+            max_workers: Maximum number of repositories checked out at the same time
             
         Returns:
             Dictionary with checkout statistics (success, failed, skipped counts)
@@ -144,57 +190,82 @@ class RepositoryManager:
 
         total = len(repo_list)
         
-        for i, repo_info in enumerate(repo_list, 1):
-            repo_name = repo_info['full_name']
-            sha = repo_info.get('sha')
-            
-            if not sha:
-                logger.warning(f"No SHA provided for {repo_name}, skipping checkout")
-                raise RuntimeError(f"No SHA provided for {repo_name}, skipping checkout")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._checkout_one, repo_info, i, total)
+                for i, repo_info in enumerate(repo_list, 1)
+            ]
+            try:
+                for future in as_completed(futures):
+                    # Re-raise checkout failures as before
+                    future.result()
+            except BaseException:
+                # Fail fast like the serial loop: drop queued checkouts instead of
+                # letting the pool finish them all before the error surfaces
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    def _checkout_one(self, repo_info: Dict, i: int, total: int) -> None:
+        """Checkout the dataset commit of a single cloned repository.
+        
+        Args:
+            repo_info: Repository information dictionary containing 'full_name' and 'sha'
+            i: 1-based position of the repository, for progress logging
+            total: Number of repositories being checked out
             
-            # Get local directory name from repository name
-            # local_repo_name = repo_name.split('/')[-1]
-            repo_path = os.path.join(self.repos_dir, repo_name)
+        Raises:
+            RuntimeError: If the repository or SHA is missing or the checkout fails
+        """
+        repo_name = repo_info['full_name']
+        sha = repo_info.get('sha')
+        
+        if not sha:
+            logger.warning(f"No SHA provided for {repo_name}, skipping checkout")
+            raise RuntimeError(f"No SHA provided for {repo_name}, skipping checkout")
+        
+        # Get local directory name from repository name
+        # local_repo_name = repo_name.split('/')[-1]
+        repo_path = os.path.join(self.repos_dir, repo_name)
+        
+        # Check if repository exists
+        if not os.path.exists(repo_path):
+            logger.error(f"Repository {repo_name} not found at {repo_path}, skipping checkout")
+            raise RuntimeError(f"Repository {repo_name} not found at {repo_path}")
+
+        
+        logger.info(f"Checking out {repo_name} at commit {sha} ({i}/{total})")
+        
+        try:
+            repo = pygit2.Repository(repo_path)
             
-            # Check if repository exists
-            if not os.path.exists(repo_path):
-                logger.error(f"Repository {repo_name} not found at {repo_path}, skipping checkout")
-                raise RuntimeError(f"Repository {repo_name} not found at {repo_path}")
+            # Get the commit object from SHA
+            commit = repo.get(sha)
+            if not commit:
+                logger.error(f"Commit {sha} not found in {repo_name}")
+                commit = repo.revparse_single('HEAD')
 
+            # The specified sha in the dataset no longer exist so we will use HEAD
+            if repo_name in REPOSITORIES_THAT_SHOULD_USE_HEAD:
+                logger.info(f"Skipping checkout for {repo_name}")
+                print(f"Skipping checkout for {repo_name}")
+                commit = repo.revparse_single('HEAD')
+
+            # Checkout the commit
+            repo.checkout_tree(commit)
             
-            logger.info(f"Checking out {repo_name} at commit {sha} ({i}/{total})")
+            # Update HEAD to point to the commit
+            repo.set_head(commit.id)
             
-            try:
-                repo = pygit2.Repository(repo_path)
-                
-                # Get the commit object from SHA
-                commit = repo.get(sha)
-                if not commit:
-                    logger.error(f"Commit {sha} not found in {repo_name}")
-                    commit = repo.revparse_single('HEAD')
-
-                # The specified sha in the dataset no longer exist so we will use HEAD
-                if repo_name in REPOSITORIES_THAT_SHOULD_USE_HEAD:
-                    logger.info(f"Skipping checkout for {repo_name}")
-                    print(f"Skipping checkout for {repo_name}")
-                    commit = repo.revparse_single('HEAD')
-
-                # Checkout the commit
-                repo.checkout_tree(commit)
-                
-                # Update HEAD to point to the commit
-                repo.set_head(commit.id)
-                
-                logger.info(f"Successfully checked out {repo_name} at {sha}")
-
-
-            except pygit2.GitError as e:
-                logger.error(f"Git error during checkout of {repo_name}: {e}")
-                raise RuntimeError(f"Git error during checkout of {repo_name}: {e}")
-            except Exception as e:
-                logger.error(f"Failed to checkout {repo_name} at {sha}: {e}")
-                raise RuntimeError(f"Anonymous Error: Failed to checkout {repo_name} at {sha}: {e}")
-        
-            logger.info(
-                f"Checkout completed: {repo_name} successful, "
-            )
\ No newline at end of file
+            logger.info(f"Successfully checked out {repo_name} at {sha}")
+
+
+        except pygit2.GitError as e:
+            logger.error(f"Git error during checkout of {repo_name}: {e}")
+            raise RuntimeError(f"Git error during checkout of {repo_name}: {e}")
+        except Exception as e:
+            logger.error(f"Failed to checkout {repo_name} at {sha}: {e}")
+            raise RuntimeError(f"Anonymous Error: Failed to checkout {repo_name} at {sha}: {e}")
+        
+        logger.info(
+            f"Checkout completed: {repo_name} successful, "
+        )
\ No newline at end of file
@@ -1,24 +1,32 @@
 """Main script for analyzing Policy as Code maintenance activities in repositories."""
 import argparse
-import json
 import logging
+import multiprocessing
+import operator
+import os
+import string
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from itertools import chain
 from datetime import datetime
 import time
 
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
+
+import orjson
 
 from modules.config import (
     REPOS_DIR,
     PAC_FILE_NAMES_CSV_PATH,
     DEFAULT_REPOS_CSV,
     REPOS_TEST_CSV_PATH,
-    USE_TEST_MODE
+    USE_TEST_MODE,
+    OBJECT_CACHE_TOTAL_SIZE,
+    OBJECT_CACHE_MIN_WORKER_SIZE,
+    ROOT_DIR
 )
-from modules.pac_analyzer import PacAnalyzer
-from modules.repository_manager import RepositoryManager
 
 
 @dataclass
@@ -29,6 +37,7 @@ class AnalysisConfig:
     skip_clone: bool = False
     verbose: bool = False
     output_path: str = 'outputs/results.json'
+    clone_workers: int = 8
     
     @property
     def csv_path(self) -> str:
@@ -36,7 +45,111 @@ class AnalysisConfig:
         return REPOS_TEST_CSV_PATH if (self.use_test_mode or USE_TEST_MODE) else DEFAULT_REPOS_CSV
 
 
+# Project root used to resolve relative output paths
+_PROJECT_ROOT = Path(ROOT_DIR)
+
+# Maps every disallowed ASCII character (including path separators) to '_'
+_ALLOWED_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + '_-.')
+_SAFE_TABLE = {c: '_' for c in range(128) if chr(c) not in _ALLOWED_FILENAME_CHARS}
+
+# Plain Commit attributes copied verbatim into the JSON output
+_COMMIT_FIELDS = operator.attrgetter(
+    'commit_id', 'author', 'author_email', 'message', 'date',
+    'files', 'pac_changes', 'other_changes'
+)
+
+# PacAnalyzer loaded by the parent; forked workers share it copy-on-write
+_PAC_ANALYZER = None
+
+
+def _init_worker(pac_analyzer, object_cache_size: int) -> None:
+    """Install the parent's PacAnalyzer in a pool worker and size its git cache.
+
+    Under fork this is inherited for free; under spawn the analyzer is
+    pickled once per worker instead of each task re-reading the PAC CSV.
+
+    Args:
+        pac_analyzer: PacAnalyzer loaded by the parent process
+        object_cache_size: Bytes of libgit2 object cache this worker may use
+    """
+    from modules.git_controller import configure_object_cache
+
+    global _PAC_ANALYZER
+    _PAC_ANALYZER = pac_analyzer
+    configure_object_cache(object_cache_size)
+
+
+def _get_pac_analyzer(pac_csv: str):
+    """Return the shared PacAnalyzer, or load one when it is not available.
+
+    Args:
+        pac_csv: Path to CSV file containing PAC file definitions
+
+    Returns:
+        PacAnalyzer for the given CSV file
+    """
+    if _PAC_ANALYZER is not None and _PAC_ANALYZER.pac_files_csv_path == pac_csv:
+        return _PAC_ANALYZER
+    from modules.pac_analyzer import PacAnalyzer
+    return PacAnalyzer(pac_csv)
+
+
+def _sanitize_filename_part(name: str) -> str:
+    """Replace characters that are not valid in an output filename with '_'.
+
+    Args:
+        name: Owner or repository name
+
+    Returns:
+        Sanitized name
+    """
+    if name.isascii():
+        return name.translate(_SAFE_TABLE)
+    # Non-ASCII names keep Unicode alphanumerics, as str.isalnum does
+    return ''.join(c if c.isalnum() or c in ('_', '-', '.') else '_' for c in name)
+
 
+def _analyze_one(repo_info: Dict, repos_dir: str, pac_csv: str) -> Dict:
+    """Analyze PAC changes of a single cloned repository.
+
+    Builds its own RepositoryManager and reuses the parent's PacAnalyzer when it
+    was inherited through fork, so it can run in a worker process.
+
+    Args:
+        repo_info: Repository information dictionary with 'id' and 'full_name'
+        repos_dir: Directory where repositories are cloned
+        pac_csv: Path to CSV file containing PAC file definitions
+
+    Returns:
+        Analysis result for the repository
+
+    Raises:
+        RuntimeError: If no commits are found or the analysis fails
+    """
+    from modules.repository_manager import RepositoryManager
+
+    logger = logging.getLogger(__name__)
+    repo_id = repo_info['id']
+    full_name = repo_info['full_name']
+
+    logger.info("Analyzing repository: %s", full_name)
+
+    # Stream commit changes straight into the analyzer instead of building a dict first
+    changes = RepositoryManager(repos_dir).iter_repository_changes(full_name)
+    first_change = next(changes, None)
+    if first_change is None:
+        logger.warning("No commits found for %s", full_name)
+        raise RuntimeError(f"No commits found for {full_name}")
+    changes = chain((first_change,), changes)
+
+    # Analyze PAC changes
+    try:
+        analysis_result = _get_pac_analyzer(pac_csv).analyze_repository(repo_id, full_name, changes, full_name)
+        logger.debug("Successfully analyzed %s", full_name)
+        return analysis_result
+    except Exception as e:
+        logger.error("Failed to analyze %s: %s", full_name, e)
+        raise RuntimeError(f"Failed to analyze {full_name}: {e}")
 
 
 class DataCollector:
@@ -48,6 +161,10 @@ class DataCollector:
         Args:
             config: Analysis configuration
         """
+        # Imported here so argument parsing and --help do not load pandas/pygit2
+        from modules.pac_analyzer import PacAnalyzer
+        from modules.repository_manager import RepositoryManager
+
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.repo_manager = RepositoryManager(REPOS_DIR)
@@ -71,7 +188,7 @@ class DataCollector:
         Raises:
             RuntimeError: If no repositories are loaded
         """
-        self.logger.info(f"Using repository list from: {self.config.csv_path}")
+        self.logger.info("Using repository list from: %s", self.config.csv_path)
         
         repo_list = self.repo_manager.load_repositories(
             self.config.csv_path, 
@@ -81,7 +198,7 @@ class DataCollector:
         if not repo_list:
             raise RuntimeError("No repositories loaded")
         
-        self.logger.info(f"Loaded {len(repo_list)} repositories")
+        self.logger.info("Loaded %d repositories", len(repo_list))
         return repo_list
     
     def clone_and_checkout_repositories(self, repo_list: List[Dict]) -> None:
@@ -99,63 +216,91 @@ class DataCollector:
         
         # Clone repositories
         self.logger.info("Starting repository cloning...")
-        self.repo_manager.clone_repositories(repo_list)
+        self.repo_manager.clone_repositories(repo_list, max_workers=self.config.clone_workers)
         
 
         
         # Checkout specific commits
         self.logger.info("Starting repository checkout...")
-        self.repo_manager.checkout(repo_list)
+        self.repo_manager.checkout(repo_list, max_workers=self.config.clone_workers)
         
         self.logger.info(
-            f"Repository preparation complete. "
+            "Repository preparation complete. "
         )
     
-    def analyze_repositories(self, repo_list: List[Dict]) -> List[Dict]:
+    def analyze_repositories(self, repo_list: List[Dict],
+                             on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
         """Analyze PAC changes in all cloned repositories.
         
         Args:
             repo_list: List of repository information
+            on_result: Optional callback that receives each analysis result as soon
+                as it is available, in completion order. When given, the returned
+                results omit per-commit data (also in completion order) so it can
+                be released early.
             
         Returns:
-            List of analysis results for each repository
+            List of analysis results for each repository, in repository list order
+            unless on_result is given
         """
-        results = []
+        results = {}
         cloned_repos = self.repo_manager.get_cloned_repositories()
         
         if not cloned_repos:
             self.logger.warning("No cloned repositories found to analyze")
             raise RuntimeError("No cloned repositories found to analyze")
         
-        self.logger.info(f"Analyzing {len(cloned_repos)} repositories...")
-        
-        for repo_info in repo_list:
-            # print(repo)
-            # Find repository info
+        self.logger.info("Analyzing %d repositories...", len(cloned_repos))
 
-            
-            repo_id = repo_info['id']
-            full_name = repo_info['full_name']
-            
-            self.logger.info(f"Analyzing repository: {full_name}")
-            
-            # Get commit changes
-            changes = self.repo_manager.get_repository_changes(full_name)
-            if not changes:
-                self.logger.warning(f"No commits found for {full_name}")
-                raise RuntimeError(f"No commits found for {full_name}")
-            
-            # Analyze PAC changes
-            try:
-                analysis_result = self.pac_analyzer.analyze_repository(repo_id, full_name, changes, full_name)
-                results.append(analysis_result)
-                self.logger.debug(f"Successfully analyzed {full_name}")
-            except Exception as e:
-                self.logger.error(f"Failed to analyze {full_name}: {e}")
-                raise RuntimeError(f"Failed to analyze {full_name}: {e}")
-        
-        self.logger.info(f"Analysis completed for {len(results)} repositories")
-        return results
+        def deliver(index: int, result: Dict) -> None:
+            if on_result is None:
+                results[index] = result
+                return
+            on_result(result)
+            results[index] = {k: v for k, v in result.items() if k not in ('commits', 'statistics')}
+        
+        # Share the already loaded PAC definitions with the workers instead of
+        # having every worker parse the CSV again
+        global _PAC_ANALYZER
+        _PAC_ANALYZER = self.pac_analyzer
+        
+        if len(repo_list) == 1:
+            # A single repository does not need a worker pool
+            from modules.git_controller import configure_object_cache
+            configure_object_cache(OBJECT_CACHE_TOTAL_SIZE)
+            deliver(0, _analyze_one(repo_list[0], REPOS_DIR, PAC_FILE_NAMES_CSV_PATH))
+        else:
+            # Repositories are independent, so analyze them concurrently across cores
+            # fork lets workers inherit the analyzer copy-on-write; with other start
+            # methods the initializer hands each worker one pickled copy
+            mp_context = (multiprocessing.get_context('fork')
+                          if 'fork' in multiprocessing.get_all_start_methods() else None)
+            max_workers = os.cpu_count() or 1
+            # libgit2's cache limit is per process, so split the budget between
+            # workers, but never go below libgit2's own default per worker
+            object_cache_size = max(OBJECT_CACHE_TOTAL_SIZE // max_workers, OBJECT_CACHE_MIN_WORKER_SIZE)
+            initargs = (self.pac_analyzer, object_cache_size)
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                     initializer=_init_worker, initargs=initargs) as executor:
+                futures = {
+                    executor.submit(_analyze_one, repo_info, REPOS_DIR, PAC_FILE_NAMES_CSV_PATH): i
+                    for i, repo_info in enumerate(repo_list)
+                }
+                try:
+                    # Deliver each result as soon as it completes, so a slow repository
+                    # never holds finished ones back in memory
+                    for future in as_completed(futures):
+                        deliver(futures[future], future.result())
+                except BaseException:
+                    # Fail fast like the serial loop: drop queued repositories instead
+                    # of letting the pool run them all before the error surfaces
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        
+        self.logger.info("Analysis completed for %d repositories", len(results))
+        if on_result is None:
+            return [results[i] for i in sorted(results)]
+        return list(results.values())
     
     def serialize_commit_for_json(self, commit) -> Dict:
         """Convert a single Commit object to JSON-serializable format.
@@ -166,57 +311,61 @@ class DataCollector:
         Returns:
             Dictionary representation of the commit
         """
-        if hasattr(commit, '__dict__'):
-            return {
-                'commit_id': commit.commit_id,
-                'author': commit.author,
-                'author_email': commit.author_email,
-                'message': commit.message,
-                'date': commit.date,
-                'files': commit.files,
-                'pac_changes': commit.pac_changes,
-                'other_changes': commit.other_changes,
-                'has_pac_changes': commit.has_pac_changes(),
-                'pac_added_lines': commit.get_pac_added_lines(),
-                'pac_deleted_lines': commit.get_pac_deleted_lines(),
-                'total_added_lines': commit.get_total_added_lines(),
-                'total_deleted_lines': commit.get_total_deleted_lines()
-            }
-        else:
+        # Commit uses __slots__, so recognise it by its attributes rather than __dict__
+        if not hasattr(commit, 'commit_id'):
             return commit
+        
+        commit_id, author, author_email, message, date, files, pac_changes, other_changes = _COMMIT_FIELDS(commit)
+        return {
+            'commit_id': commit_id,
+            'author': author,
+            'author_email': author_email,
+            'message': message,
+            'date': date,
+            'files': files,
+            'pac_changes': pac_changes,
+            'other_changes': other_changes,
+            'has_pac_changes': commit.has_pac_changes(),
+            'pac_added_lines': commit.get_pac_added_lines(),
+            'pac_deleted_lines': commit.get_pac_deleted_lines(),
+            'total_added_lines': commit.get_total_added_lines(),
+            'total_deleted_lines': commit.get_total_deleted_lines()
+        }
     
-    def serialize_results_for_json(self, results: List[Dict], start_time) -> Dict:
-        """Convert results to JSON-serializable format.
+    def serialize_result_for_json(self, result: Dict) -> Dict:
+        """Convert a single repository result to JSON-serializable format.
         
         Args:
-            results: List of analysis results from repositories
+            result: Analysis result from a repository
             
         Returns:
             Dictionary ready for JSON serialization
         """
-        serialized_results = []
+        # Build a new dict without the statistics field, leaving the original untouched
+        serialized_result = {k: v for k, v in result.items() if k != 'statistics'}
         
-        for result in results:
-            # Create a copy to avoid modifying the original
-            serialized_result = result.copy()
-            
-            # Remove statistics field if present
-            if 'statistics' in serialized_result:
-                del serialized_result['statistics']
-            
-            # Convert Commit objects to dictionaries if present
-            if 'commits' in serialized_result:
-                commits_data = [
-                    self.serialize_commit_for_json(commit) 
-                    for commit in serialized_result['commits']
-                ]
-                serialized_result['commits'] = commits_data
+        # Convert Commit objects to dictionaries if present
+        if 'commits' in serialized_result:
+            serialize_commit = self.serialize_commit_for_json
+            serialized_result['commits'] = [
+                serialize_commit(commit)
+                for commit in serialized_result['commits']
+            ]
+        
+        return serialized_result
+    
+    def build_metadata(self, start_time) -> Dict:
+        """Build the metadata block describing this analysis run.
+        
+        Args:
+            start_time: Time the analysis started (seconds since the epoch)
             
-            serialized_results.append(serialized_result)
+        Returns:
+            Dictionary with timing and configuration details
+        """
         end_time = time.time()
         execution_time = end_time - start_time
-        # Create metadata
-        metadata = {
+        return {
             'analysis_start': start_time,
             'analysis_endtime': end_time,
             'analysis_duration': execution_time,
@@ -227,92 +376,113 @@ class DataCollector:
                 'pac_file_names_csv': PAC_FILE_NAMES_CSV_PATH
             }
         }
-        
-        return {
-            'metadata': metadata,
-            'repositories': serialized_results
-        }
-
+    
     def get_output_filename(self, owner_name, repository_name):
         if owner_name and repository_name:
             # Replace problematic characters for valid filename
-            safe_owner = owner_name.replace('/', '_').replace('\\', '_')
-            safe_owner = ''.join(c if c.isalnum() or c in ('_', '-', '.') else '_' for c in safe_owner)
-            safe_repo = repository_name.replace('/', '_').replace('\\', '_')
-            safe_repo = ''.join(c if c.isalnum() or c in ('_', '-', '.') else '_' for c in safe_repo)
+            safe_owner = _sanitize_filename_part(owner_name)
+            safe_repo = _sanitize_filename_part(repository_name)
 
             # Ensure the output directory exists
-            output_dir = Path("outputs") / safe_owner
-            if not output_dir.exists():
-                output_dir.mkdir(parents=True, exist_ok=True)
+            (Path("outputs") / safe_owner).mkdir(parents=True, exist_ok=True)
 
             return f"outputs/{safe_owner}/{safe_repo}.json"
         else:
             raise ValueError("Owner name and repository name are required")
 
-    def get_output_filename_from_results(self, results: List[Dict]) -> str:
-        """Determine the output filename based on configuration and results.
+    def get_output_filename_from_repo_list(self, repo_list: List[Dict]) -> str:
+        """Determine the output filename before analysis, from the repository list.
+        
+        Computed before analysis starts so the file can be opened up front. When a
+        single repository is requested, the file is named after it.
         
         Args:
-            results: List of analysis results
+            repo_list: List of repository information
             
         Returns:
             Output filename
         """
-        # If repository_no is specified and we have exactly one result, use repository name
-        if self.config.repository_no is not None and len(results) == 1:
-            # Prefer project_name (e.g., 'aws/aws-cdk') over repository_name (e.g., 'aws-cdk')
-            owner_name = results[0].get('owner_name')
-            repository_name = results[0].get('repository_name', '')
-            return self.get_output_filename(owner_name, repository_name)
-
+        if self.config.repository_no is not None and len(repo_list) == 1:
+            full_name = repo_list[0].get('full_name', '')
+            if '/' in full_name:
+                owner_name, _, rest = full_name.partition('/')
+                repository_name = rest.partition('/')[0]
+                return self.get_output_filename(owner_name, repository_name)
         
-        # Otherwise, use the configured output path
         return self.config.output_path
     
-    def save_results_to_json(self, results: List[Dict], start_time) -> str:
-        """Save analysis results to JSON file.
+    def resolve_output_path(self, output_filename: str) -> Path:
+        """Resolve an output filename against the project root.
         
         Args:
-            results: List of analysis results from repositories
+            output_filename: Absolute or project-relative output filename
             
         Returns:
-            Absolute path to the saved file
-            
-        Raises:
-            RuntimeError: If saving fails
+            Absolute output path
         """
-        try:
-            # Determine output filename
-            output_filename = self.get_output_filename_from_results(results)
-            
-            # Log if we're using repository name
-            if output_filename != self.config.output_path:
-                self.logger.info(f"Using repository name for output: {output_filename}")
-            
-            # Resolve output path
-            output_path = Path(output_filename)
-            if not output_path.is_absolute():
-                # If relative path, make it relative to the project root
-                project_root = Path(__file__).parent.parent
-                output_path = project_root / output_path
+        output_path = Path(output_filename)
+        if not output_path.is_absolute():
+            # If relative path, make it relative to the project root
+            output_path = _PROJECT_ROOT / output_path
+        return output_path
+    
+    def stream_results_to_json(self, repo_list: List[Dict], start_time) -> Tuple[List[Dict], str]:
+        """Analyze repositories and append each result to the JSON file as it finishes.
+        
+        Each repository is written as soon as its analysis completes, so at most
+        the results produced by the running workers are held in memory at once.
+        Repositories appear in completion order; readers do not depend on it. The
+        file is written as '<output>.partial' and moved into place once every
+        repository has been written, so a crash keeps the partial results without
+        leaving an output that looks complete.
+        
+        Args:
+            repo_list: List of repository information
+            start_time: Time the analysis started (seconds since the epoch)
             
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        Returns:
+            Tuple of (analysis results without per-commit data, absolute output path)
             
-            # Convert results to JSON-serializable format
-            json_data = self.serialize_results_for_json(results, start_time)
+        Raises:
+            RuntimeError: If analysis or saving fails
+        """
+        output_filename = self.get_output_filename_from_repo_list(repo_list)
+        if output_filename != self.config.output_path:
+            self.logger.info("Using repository name for output: %s", output_filename)
+        
+        output_path = self.resolve_output_path(output_filename)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = output_path.with_name(output_path.name + '.partial')
+        
+        written = 0
+        with open(partial_path, 'wb', buffering=1 << 20) as f:
+            f.write(b'{"repositories":[')
             
-            # Write to JSON file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            def write_result(result: Dict) -> None:
+                nonlocal written
+                if written:
+                    f.write(b',')
+                written += 1
+                f.write(orjson.dumps(self.serialize_result_for_json(result), option=orjson.OPT_NON_STR_KEYS))
             
-            absolute_path = str(output_path.resolve())
-            self.logger.info(f"Results saved to {absolute_path}")
-            return absolute_path
+            results = self.analyze_repositories(repo_list, on_result=write_result)
             
-        except Exception as e:
+            f.write(b'],"metadata":')
+            f.write(orjson.dumps(self.build_metadata(start_time), option=orjson.OPT_NON_STR_KEYS))
+            f.write(b'}')
+        
+        if not results:
+            partial_path.unlink()
+            return results, ''
+        
+        try:
+            os.replace(partial_path, output_path)
+        except OSError as e:
             raise RuntimeError(f"Failed to save results to JSON: {e}") from e
+        
+        absolute_path = str(output_path.resolve())
+        self.logger.info("Results saved to %s", absolute_path)
+        return results, absolute_path
     
     def print_summary(self, results: List[Dict], output_path: str) -> None:
         """Print analysis summary to console.
@@ -322,9 +492,12 @@ class DataCollector:
             output_path: Path where results were saved
         """
         total_repos = len(results)
-        total_commits = sum(r.get('total_commits', 0) for r in results)
-        total_pac_changes = sum(r.get('pac_changes_count', 0) for r in results)
-        total_pac_commits = sum(r.get('pac_commits_count', 0) for r in results)
+        # Accumulate all totals in a single pass over the results
+        total_commits = total_pac_changes = total_pac_commits = 0
+        for r in results:
+            total_commits += r.get('total_commits', 0)
+            total_pac_changes += r.get('pac_changes_count', 0)
+            total_pac_commits += r.get('pac_commits_count', 0)
         
         print(f"\n{'='*70}")
         print("POLICY AS CODE ANALYSIS SUMMARY")
@@ -361,17 +534,14 @@ class DataCollector:
             # Clone and checkout repositories
             self.clone_and_checkout_repositories(repo_list)
             
-            # Analyze repositories
-            results = self.analyze_repositories(repo_list)
+            # Analyze repositories, saving each result to JSON as it completes
+            results, output_path = self.stream_results_to_json(repo_list, start_time)
 
 
             if not results:
                 self.logger.warning("No analysis results generated")
                 return 1
             
-            # Save results to JSON
-            output_path = self.save_results_to_json(results, start_time)
-            
             # Print summary
             self.print_summary(results, output_path)
             
@@ -379,7 +549,7 @@ class DataCollector:
             return 0
             
         except Exception as e:
-            self.logger.error(f"Fatal error: {e}", exc_info=True)
+            self.logger.error("Fatal error: %s", e, exc_info=True)
             return 1
 
     def is_exist_outputfiles(self, repo_list: List[Dict]) -> bool:
@@ -397,21 +567,16 @@ class DataCollector:
             full_name = repo.get('full_name', '')
             
             if full_name and '/' in full_name:
-                owner_name, repository_name = full_name.split('/', 1)
+                owner_name, _, repository_name = full_name.partition('/')
                 try:
                     output_filename = self.get_output_filename(owner_name, repository_name)
-                    output_path = Path(output_filename)
-                    
-                    # Make absolute path if needed
-                    if not output_path.is_absolute():
-                        project_root = Path(__file__).parent.parent
-                        output_path = project_root / output_path
+                    output_path = self.resolve_output_path(output_filename)
                     
                     if output_path.exists():
-                        self.logger.info(f"Output file already exists: {output_path}")
+                        self.logger.info("Output file already exists: %s", output_path)
                         return True
                 except Exception as e:
-                    self.logger.debug(f"Error checking output file: {e}")
+                    self.logger.debug("Error checking output file: %s", e)
                     return False
         
         # For multiple repositories, we proceed with analysis
@@ -458,6 +623,13 @@ Note: When using --repository_no, the output file is automatically named
         action='store_true',
         help='Skip cloning and only analyze existing repositories'
     )
+    parser.add_argument(
+        '--clone-workers',
+        type=int,
+        default=8,
+        metavar='N',
+        help='Number of repositories to clone and check out concurrently (default: %(default)s)'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -491,7 +663,8 @@ def main() -> int:
         use_test_mode=args.test,
         skip_clone=args.no_clone,
         verbose=args.verbose,
-        output_path=args.output
+        output_path=args.output,
+        clone_workers=args.clone_workers
     )
     
     # Create and run data collector
@@ -3,14 +3,16 @@
 import logging
 import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterator, Tuple
 import os
 from p1_data_collect import AnalysisConfig, DataCollector
 from modules.repository_manager import RepositoryManager
-from modules.config import REPOS_DIR, DEFAULT_REPOS_CSV, OUTPUTS_DIR, NO_LONGER_EXIST_REPOSITORIES
+from modules.config import REPOS_DIR, DEFAULT_REPOS_CSV, OUTPUTS_DIR, NO_LONGER_EXIST_REPOSITORIES, ROOT_DIR
 
 import pandas as pd
 
+# Project root used to resolve relative output paths
+_PROJECT_ROOT = Path(ROOT_DIR)
 
 
 def load_repository_list(csv_path: str) -> List[Dict[str, str]]:
@@ -31,47 +33,69 @@ def load_repository_list(csv_path: str) -> List[Dict[str, str]]:
         return repositories
 
     except Exception as e:
-        logging.error(f"Failed to load repositories from {csv_path}: {e}")
+        logging.error("Failed to load repositories from %s: %s", csv_path, e)
         raise
 
 
-def find_output_files(output_dir: str) -> Dict[str, Path]:
-    """Find all output files in the outputs directory.
+def iter_output_files(output_dir: str) -> Iterator[Tuple[str, Path]]:
+    """Lazily yield output files from the outputs directory as they are found.
     
     Args:
         output_dir: Directory containing output files
         
-    Returns:
-        Dictionary mapping repository names to their output file paths
+    Yields:
+        Tuples of (owner/repository name, output file path); files directly
+        under the outputs directory are keyed by their stem alone
     """
     output_path = Path(output_dir)
 
     # If the path is not absolute, make it relative to the project root
     if not output_path.is_absolute():
-        project_root = Path(__file__).parent.parent
-        output_path = project_root / output_path
+        output_path = _PROJECT_ROOT / output_path
 
     if not output_path.exists():
-        logging.warning(f"Output directory does not exist: {output_path}")
-        return {}
-
-    # Find all JSON files recursively
-    json_files = list(output_path.rglob("*.json"))
-
-    # Create a mapping of repository names to file paths
-    output_files = {}
-    for json_file in json_files:
-        # Skip aggregated results file
-        if json_file.name == 'aggregated_results.json':
-            continue
-
-        # Get the repository name from the file path
-        # Expected structure: outputs/owner_repo/repo.json
-        repo_name = json_file.stem  # filename without extension
-        owner_repo = json_file.parent.name
-        output_files[f"{owner_repo}/{repo_name}"] = json_file
-
-    logging.info(f"Found {len(output_files)} output files in {output_path}")
+        logging.warning("Output directory does not exist: %s", output_path)
+        return
+
+    # Walk JSON files with an explicit stack; DirEntry carries the file type
+    # from readdir, so no per-entry stat call is needed
+    root = str(output_path)
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                # Skip aggregated results file
+                if not entry.name.endswith('.json') or entry.name == 'aggregated_results.json':
+                    continue
+
+                # Get the repository name from the file path
+                # Expected structure: outputs/owner_repo/repo.json; keying by
+                # owner as well keeps same-named repositories of different owners apart
+                json_file = Path(entry.path)
+                repo_name = json_file.stem  # filename without extension
+                if directory == root:
+                    # Files directly under the outputs directory have no owner
+                    yield repo_name, json_file
+                else:
+                    owner_repo = json_file.parent.name
+                    yield f"{owner_repo}/{repo_name}", json_file
+
+
+def find_output_files(output_dir: str) -> Dict[str, Path]:
+    """Find all output files in the outputs directory.
+    
+    Args:
+        output_dir: Directory containing output files
+        
+    Returns:
+        Dictionary mapping repository names to their output file paths
+    """
+    output_files = dict(iter_output_files(output_dir))
+    logging.info("Found %d output files in %s", len(output_files), output_dir)
     return output_files
 
 
@@ -81,24 +105,15 @@ def main() -> int:
         # Load repository list from CSV
         logging.info("Loading repository list from CSV...")
         repositories = load_repository_list(DEFAULT_REPOS_CSV)
-        missed_repositories = set()
-        for r in repositories:
-            missed_repositories.add(r['full_name'])
+        missed_repositories = {r['full_name'] for r in repositories}
         number_of_studied_repositories = len(missed_repositories)
         print("# of all repos", number_of_studied_repositories)
         # Find output files
         logging.info("Scanning output directory for result files...")
         output_files = find_output_files(OUTPUTS_DIR)
 
-        for f in output_files:
-            path = output_files[f]
-            if not str(path).endswith('.json'):
-                continue
-            parent_dir_name = os.path.basename(os.path.dirname(path))
-            file_name = os.path.splitext(os.path.basename(path))[0]
-            full_name = f"{parent_dir_name}/{file_name}"
-            if full_name in missed_repositories:
-                missed_repositories.remove(full_name)
+        # Keys are already "owner/repository" names derived from the file paths
+        missed_repositories.difference_update(output_files)
 
         # print("-These projects might not have been collected yet.:------------------")
         # print("\n".join(sorted(missed_repositories)))
@@ -110,15 +125,16 @@ def main() -> int:
         number_of_misses = len(missed_repositories)
         print("Missed repositories:", number_of_misses, f"{number_of_misses / number_of_studied_repositories}%")
 
+        # Index repository numbers (1-based) by name once instead of scanning per miss
+        repository_numbers = {}
+        for i, r in enumerate(repositories, 1):
+            repository_numbers.setdefault(r['full_name'], i)
+
         for m in missed_repositories:
-            i = 0
-            for r in repositories:
-                i += 1
-                if r['full_name'] == m:
-                    print(r['full_name'], i)
-                    break
+            i = repository_numbers[m]
+            print(m, i)
             if RETRIEVE_MISSED_REPOSITORIES:
-                if r['full_name'] in NO_LONGER_EXIST_REPOSITORIES:
+                if m in NO_LONGER_EXIST_REPOSITORIES:
                     continue
                 config = AnalysisConfig(
                     repository_no=i,
@@ -135,7 +151,7 @@ def main() -> int:
         return 0
 
     except Exception as e:
-        logging.error(f"Fatal error: {e}", exc_info=True)
+        logging.error("Fatal error: %s", e, exc_info=True)
         return 1
 
 RETRIEVE_MISSED_REPOSITORIES = False
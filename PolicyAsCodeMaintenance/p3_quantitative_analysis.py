@@ -1,10 +1,12 @@
+import os
 import sys
-import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
 import statistics
+from concurrent.futures import ThreadPoolExecutor
 
+import ijson
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
@@ -16,35 +18,62 @@ from PolicyAsCodeMaintenance.modules.config import (
     FIGSIZE,
     OUTPUTS_DIR
 )
-from PolicyAsCodeMaintenance.p2_data_validate import find_output_files
+from PolicyAsCodeMaintenance.p2_data_validate import iter_output_files
 
 # Visualization settings
 PALETTE = ['#E8E8E8', '#808080', '#C0C0C0', '#404040']
 sns.set_style("whitegrid")
 sns.set_palette("gray")
-def read_outputfiles(output_files: Dict[str, Path]) -> List[Dict[str, Any]]:
+def read_outputfile(repo_name: str, file_path: Path) -> Optional[Dict[str, Any]]:
+    """Read and parse a single repository output file.
+    
+    Only the 'repositories' array is kept; it is streamed item by item so the
+    rest of the document (e.g. metadata) is never materialized.
+    
+    Args:
+        repo_name: Repository name the file belongs to
+        file_path: Path to the output file
+        
+    Returns:
+        Dictionary containing repository data, or None if the file cannot be read
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            # Let the kernel read ahead aggressively; the file is consumed front to back
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            repositories = list(ijson.items(f, 'repositories.item', use_float=True))
+        logging.info(f"Successfully read data from {file_path}")
+        return {
+            'repository': repo_name,
+            'file_path': str(file_path),
+            'data': {'repositories': repositories}
+        }
+    except Exception as e:
+        logging.error(f"Error reading {file_path}: {e}")
+        return None
+
+
+def read_outputfiles(output_files: Union[Dict[str, Path], Iterable[Tuple[str, Path]]]) -> List[Dict[str, Any]]:
     """Read and parse output files from repositories.
     
+    Files are read concurrently on a thread pool; the result keeps the input
+    order. Passing the iter_output_files generator lets the directory walk
+    overlap with parsing.
+    
     Args:
-        output_files: Dictionary mapping repository names to file paths
+        output_files: Dictionary mapping repository names to file paths, or an
+            iterable of (repository name, file path) pairs
         
     Returns:
         List of dictionaries containing repository data
     """
-    all_data = []
-    for repo_name, file_path in output_files.items():
-        try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                all_data.append({
-                    'repository': repo_name,
-                    'file_path': str(file_path),
-                    'data': data
-                })
-                logging.info(f"Successfully read data from {file_path}")
-        except Exception as e:
-            logging.error(f"Error reading {file_path}: {e}")
-            continue
+    if isinstance(output_files, dict):
+        output_files = output_files.items()
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        loaded = executor.map(lambda item: read_outputfile(*item), output_files)
+        all_data = [item for item in loaded if item is not None]
 
     print(f"Successfully read {len(all_data)} output files")
     for item in all_data:
@@ -542,8 +571,7 @@ def main() -> int:
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
         
         # Find and read output files
-        output_files = find_output_files(OUTPUTS_DIR)
-        data = read_outputfiles(output_files)
+        data = read_outputfiles(iter_output_files(OUTPUTS_DIR))
         
         # Perform analyses
         frequencies = measure_pac_maintenance_frequency(data)
@@ -7,7 +7,7 @@ from typing import Dict, List, Any
 
 # Import data loading functions from quantitative_analysis
 from p3_quantitative_analysis import read_outputfiles
-from p2_data_validate import find_output_files
+from p2_data_validate import iter_output_files
 from modules.config import OUTPUTS_DIR
 
 
@@ -156,26 +156,37 @@ def generate_commit_statistics(commits: List[Dict]) -> Dict:
     if not commits:
         return {}
     
-    # Count commits by project
+    # Accumulate all per-commit totals in a single pass
     project_counts = {}
+    pac_files_total = 0
+    other_files_total = 0
+    pac_line_changes = 0
+    total_line_changes = 0
+    commits_with_only_pac = 0
+    commits_with_mixed_changes = 0
     for commit in commits:
         project = commit['project_name']
         project_counts[project] = project_counts.get(project, 0) + 1
+        pac_files_total += commit['pac_files_count']
+        other_files_total += commit['other_files_count']
+        pac_line_changes += commit['pac_added_lines'] + commit['pac_deleted_lines']
+        total_line_changes += commit['total_added_lines'] + commit['total_deleted_lines']
+        if commit['other_files_count'] == 0:
+            commits_with_only_pac += 1
+        elif commit['other_files_count'] > 0:
+            commits_with_mixed_changes += 1
     
-    # Calculate line change statistics
-    pac_line_changes = [c['pac_added_lines'] + c['pac_deleted_lines'] for c in commits]
-    total_line_changes = [c['total_added_lines'] + c['total_deleted_lines'] for c in commits]
-    
+    total_commits = len(commits)
     stats = {
-        'total_commits': len(commits),
-        'unique_projects': len(set(c['project_name'] for c in commits)),
+        'total_commits': total_commits,
+        'unique_projects': len(project_counts),
         'commits_by_project': project_counts,
-        'avg_pac_files_per_commit': sum(c['pac_files_count'] for c in commits) / len(commits),
-        'avg_other_files_per_commit': sum(c['other_files_count'] for c in commits) / len(commits),
-        'avg_pac_line_changes': sum(pac_line_changes) / len(commits),
-        'avg_total_line_changes': sum(total_line_changes) / len(commits),
-        'commits_with_only_pac': len([c for c in commits if c['other_files_count'] == 0]),
-        'commits_with_mixed_changes': len([c for c in commits if c['other_files_count'] > 0])
+        'avg_pac_files_per_commit': pac_files_total / total_commits,
+        'avg_other_files_per_commit': other_files_total / total_commits,
+        'avg_pac_line_changes': pac_line_changes / total_commits,
+        'avg_total_line_changes': total_line_changes / total_commits,
+        'commits_with_only_pac': commits_with_only_pac,
+        'commits_with_mixed_changes': commits_with_mixed_changes
     }
     
     return stats
@@ -226,8 +237,7 @@ def main(sample_size: int = None, output_filename: str = None):
         
         # Load data
         print("Loading repository data...")
-        output_files = find_output_files(OUTPUTS_DIR)
-        all_data = read_outputfiles(output_files)
+        all_data = read_outputfiles(iter_output_files(OUTPUTS_DIR))
         
         # Extract PaC commits
         print("\nExtracting PaC commits...")